@@ -29,9 +29,24 @@ AUDIO_SAMPLE_RATE = 44100
 AUDIO_CHANNELS = 1
 RECORD_DURATION = 3  # 錄音時長（秒）
 
+# 錄音採集格式（語音識別只需 16kHz 單聲道 int16）
+CAPTURE_SAMPLE_RATE = int(os.getenv("CAPTURE_SAMPLE_RATE", "16000"))
+CAPTURE_DTYPES = ("int16", "float32")
+CAPTURE_DTYPE = os.getenv("CAPTURE_DTYPE", "int16")
+# 錄音存檔格式：wav / flac / opus
+AUDIO_ARCHIVE_FORMATS = ("wav", "flac", "opus")
+AUDIO_ARCHIVE_FORMAT = os.getenv("AUDIO_ARCHIVE_FORMAT", "flac").lower()
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)  # Opus 支援的採樣率
+
 # 語音轉文字設置
 STT_OUTPUT_DIR = Path("output/stt")
 
+# 輸出檔案保存設置（每個輸出目錄各自套用）
+ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_MB", "200")) * 1024 * 1024
+ARTIFACT_MAX_AGE_DAYS = float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "7"))
+ARTIFACT_COMPRESS = os.getenv("ARTIFACT_COMPRESS", "false").lower() in ("1", "true", "yes")
+ARTIFACT_QUEUE_SIZE = 32  # 背景寫入佇列長度，滿時丟棄新檔案而非阻塞
+
 # 攝像頭設置
 CAMERA_INDEX = 0  # 默認攝像頭
 CAMERA_RESOLUTION = (640, 480)
@@ -41,6 +56,23 @@ CAMERA_FPS = 30
 if not DEEPSEEK_API_KEY:
     raise ValueError("未設置 DEEPSEEK_API_KEY 環境變數")
 
+# 確保錄音格式設置有效
+if CAPTURE_DTYPE not in CAPTURE_DTYPES:
+    raise ValueError(
+        f"不支援的 CAPTURE_DTYPE: {CAPTURE_DTYPE}"
+        f"（可用: {', '.join(CAPTURE_DTYPES)}）"
+    )
+if AUDIO_ARCHIVE_FORMAT not in AUDIO_ARCHIVE_FORMATS:
+    raise ValueError(
+        f"不支援的 AUDIO_ARCHIVE_FORMAT: {AUDIO_ARCHIVE_FORMAT}"
+        f"（可用: {', '.join(AUDIO_ARCHIVE_FORMATS)}）"
+    )
+if AUDIO_ARCHIVE_FORMAT == "opus" and CAPTURE_SAMPLE_RATE not in OPUS_SAMPLE_RATES:
+    raise ValueError(
+        f"Opus 不支援 CAPTURE_SAMPLE_RATE={CAPTURE_SAMPLE_RATE}"
+        f"（可用: {', '.join(str(r) for r in OPUS_SAMPLE_RATES)}）"
+    )
+
 # 創建必要的目錄
 AUDIO_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 STT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -2,28 +2,26 @@
 
 import json
 import aiohttp
-import sounddevice as sd
-import soundfile as sf
 import speech_recognition as sr
 import numpy as np
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from config.settings import (
     DEEPSEEK_API_KEY, 
     DEEPSEEK_BASE_URL, 
     DEEPSEEK_MODEL,
-    AUDIO_SAMPLE_RATE,
     AUDIO_OUTPUT_DIR,
-    AUDIO_CHANNELS,
     RECORD_DURATION
 )
+from utils.audio_utils import AudioUtils
+from utils.artifact_store import ArtifactStore
 
 class AIAgent:
     def __init__(self):
         self.tools = {}
         self.tool_descriptions = {}
         self.recognizer = sr.Recognizer()
+        self.artifacts = ArtifactStore(AUDIO_OUTPUT_DIR)
         self._initialize_tool_descriptions()
 
     def _initialize_tool_descriptions(self):
@@ -54,30 +52,22 @@ class AIAgent:
         """錄製音頻並轉換為文字"""
         try:
             print("開始錄音（3秒）...")
-            recording = sd.rec(
-                int(RECORD_DURATION * AUDIO_SAMPLE_RATE),
-                samplerate=AUDIO_SAMPLE_RATE,
-                channels=AUDIO_CHANNELS
-            )
-            sd.wait()
+            recording, sample_rate = AudioUtils.record_speech(RECORD_DURATION)
             print("錄音完成，正在處理...")
 
-            # 保存錄音文件
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_file = AUDIO_OUTPUT_DIR / f"command_{timestamp}.wav"
-            sf.write(str(audio_file), recording, AUDIO_SAMPLE_RATE)
+            # 保存錄音文件（背景寫入，不阻塞命令處理）
+            audio_file = self.artifacts.save_audio("command", recording, sample_rate) or ""
 
-            # 將音頻轉換為文字
-            with sr.AudioFile(str(audio_file)) as source:
-                audio = self.recognizer.record(source)
-                try:
-                    text = self.recognizer.recognize_google(audio, language='zh-TW')
-                    print(f"識別的語音: '{text}'")
-                    return text, str(audio_file)
-                except sr.UnknownValueError:
-                    return "無法識別語音", str(audio_file)
-                except sr.RequestError as e:
-                    return f"語音識別服務錯誤: {str(e)}", str(audio_file)
+            # 將音頻轉換為文字（直接使用記憶體中的錄音）
+            audio = AudioUtils.to_audio_data(recording, sample_rate)
+            try:
+                text = self.recognizer.recognize_google(audio, language='zh-TW')
+                print(f"識別的語音: '{text}'")
+                return text, audio_file
+            except sr.UnknownValueError:
+                return "無法識別語音", audio_file
+            except sr.RequestError as e:
+                return f"語音識別服務錯誤: {str(e)}", audio_file
         except Exception as e:
             return f"錄音過程發生錯誤: {str(e)}", ""
 
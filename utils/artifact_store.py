@@ -0,0 +1,240 @@
+import atexit
+import gzip
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from config.settings import (
+    ARTIFACT_MAX_BYTES,
+    ARTIFACT_MAX_AGE_DAYS,
+    ARTIFACT_COMPRESS,
+    ARTIFACT_QUEUE_SIZE
+)
+from utils.audio_utils import AudioUtils
+
+INDEX_FILENAME = "index.jsonl"
+INDEX_TEXT_LIMIT = 200  # 索引中保留的文字長度
+INDEX_KEYS = ("name", "kind", "time", "bytes")
+AUDIO_SUFFIXES = (".wav", ".flac", ".ogg")
+TEXT_SUFFIXES = (".txt", ".gz")
+
+class ArtifactStore:
+    """輸出檔案存放區
+
+    由背景執行緒寫入檔案，呼叫端只需將資料放入佇列即可返回；
+    依容量與保存天數自動清理舊檔，並以 index.jsonl 記錄檔案資訊。
+    佇列已滿或檔案超過容量上限時，save_* 返回 None 表示未保存；
+    背景寫入失敗時只記錄錯誤並移除寫到一半的檔案。
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = ARTIFACT_MAX_BYTES,
+        max_age_days: float = ARTIFACT_MAX_AGE_DAYS,
+        compress: bool = ARTIFACT_COMPRESS,
+        queue_size: int = ARTIFACT_QUEUE_SIZE
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.compress = compress
+        self.index_file = self.directory / INDEX_FILENAME
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._entries = self._load_index()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        # 啟動時先清理既有檔案
+        self._queue.put_nowait({"kind": "retention"})
+        atexit.register(self.flush)
+
+    def save_audio(
+        self,
+        prefix: str,
+        data: np.ndarray,
+        sample_rate: int
+    ) -> Optional[str]:
+        """排入音頻寫入，立即返回檔案路徑；未能排入時返回 None"""
+        if data.nbytes > self.max_bytes:
+            print(f"音頻超過容量上限，略過寫入: {prefix}")
+            return None
+        filepath = self._new_path(prefix, AudioUtils.archive_suffix(sample_rate))
+        queued = self._submit({
+            "kind": "audio",
+            "path": filepath,
+            "data": data,
+            "sample_rate": sample_rate
+        })
+        return str(filepath) if queued else None
+
+    def save_text(self, prefix: str, text: str) -> Optional[str]:
+        """排入文字寫入，立即返回檔案路徑；未能排入時返回 None"""
+        if len(text.encode("utf-8")) > self.max_bytes:
+            print(f"文字超過容量上限，略過寫入: {prefix}")
+            return None
+        suffix = ".txt.gz" if self.compress else ".txt"
+        filepath = self._new_path(prefix, suffix)
+        queued = self._submit({"kind": "text", "path": filepath, "text": text})
+        return str(filepath) if queued else None
+
+    def recent(self, kind: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """從索引查詢最近的檔案（新到舊），文字記錄附帶內容摘要"""
+        with self._lock:
+            entries = [e for e in self._entries if kind is None or e["kind"] == kind]
+        return list(reversed(entries[-limit:]))
+
+    def flush(self) -> None:
+        """等待佇列中的檔案寫入完成"""
+        self._queue.join()
+
+    def _new_path(self, prefix: str, suffix: str) -> Path:
+        """生成不重複的檔名（微秒時間戳加序號）"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return self.directory / f"{prefix}_{timestamp}_{next(self._counter):04d}{suffix}"
+
+    def _submit(self, job: Dict) -> bool:
+        """將寫入排入佇列，佇列已滿時返回 False"""
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except queue.Full:
+            print(f"輸出佇列已滿，略過寫入: {job['path']}")
+            return False
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job["kind"] != "retention":
+                    self._write_job(job)
+                self._enforce_retention()
+            except Exception as e:
+                print(f"清理輸出檔案時發生錯誤: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _write_job(self, job: Dict) -> None:
+        """執行寫入，失敗時移除寫到一半的檔案"""
+        try:
+            self._write(job)
+        except Exception as e:
+            print(f"寫入輸出檔案時發生錯誤: {job['path']} {str(e)}")
+            try:
+                job["path"].unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write(self, job: Dict) -> None:
+        filepath = job["path"]
+        entry = {"name": filepath.name, "kind": job["kind"], "time": time.time()}
+        if job["kind"] == "audio":
+            AudioUtils.write_audio(filepath, job["data"], job["sample_rate"])
+        else:
+            opener = gzip.open if filepath.suffix == ".gz" else open
+            with opener(filepath, "wt", encoding="utf-8") as f:
+                f.write(job["text"])
+            entry["text"] = job["text"][:INDEX_TEXT_LIMIT]
+        entry["bytes"] = filepath.stat().st_size
+
+        with self._lock:
+            self._entries.append(entry)
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _enforce_retention(self) -> None:
+        """刪除過期檔案，並從最舊的開始刪除直到低於容量上限（含索引檔）
+
+        最新的檔案一律保留，避免剛返回給呼叫端的路徑被刪除。
+        """
+        cutoff = time.time() - self.max_age
+        index_bytes = self.index_file.stat().st_size if self.index_file.exists() else 0
+        with self._lock:
+            total = index_bytes + sum(e["bytes"] for e in self._entries)
+            keep_from = 0
+            for entry in self._entries[:-1]:
+                if entry["time"] >= cutoff and total <= self.max_bytes:
+                    break
+                total -= entry["bytes"]
+                keep_from += 1
+            if keep_from == 0:
+                return
+            expired = self._entries[:keep_from]
+            self._entries = self._entries[keep_from:]
+            entries = list(self._entries)
+
+        for entry in expired:
+            try:
+                (self.directory / entry["name"]).unlink()
+            except FileNotFoundError:
+                pass
+        self._rewrite_index(entries)
+
+    def _rewrite_index(self, entries: List[Dict]) -> None:
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_file, self.index_file)
+
+    def _load_index(self) -> List[Dict]:
+        """載入索引，略過已不存在的檔案與格式錯誤的記錄，並納入索引外的既有檔案"""
+        entries = []
+        stale = False
+        if self.index_file.exists():
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        stale = True
+                        continue
+                    if not isinstance(entry, dict) or any(k not in entry for k in INDEX_KEYS):
+                        stale = True
+                        continue
+                    if (self.directory / entry["name"]).exists():
+                        entries.append(entry)
+                    else:
+                        stale = True
+
+        indexed = {entry["name"] for entry in entries}
+        for filepath in self.directory.iterdir():
+            if filepath.name in indexed or not filepath.is_file():
+                continue
+            entry = self._scan_file(filepath)
+            if entry is not None:
+                entries.append(entry)
+                stale = True
+
+        entries.sort(key=lambda e: e["time"])
+        if stale:
+            self._rewrite_index(entries)
+        return entries
+
+    def _scan_file(self, filepath: Path) -> Optional[Dict]:
+        """為索引外的既有檔案建立記錄（以檔案修改時間與大小為準）"""
+        if filepath.suffix in AUDIO_SUFFIXES:
+            kind = "audio"
+        elif filepath.suffix in TEXT_SUFFIXES:
+            kind = "text"
+        else:
+            return None
+        stat = filepath.stat()
+        entry = {
+            "name": filepath.name,
+            "kind": kind,
+            "time": stat.st_mtime,
+            "bytes": stat.st_size
+        }
+        if filepath.suffix == ".txt":
+            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+                entry["text"] = f.read(INDEX_TEXT_LIMIT)
+        return entry
@@ -1,10 +1,37 @@
+from math import gcd
+from pathlib import Path
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
-from typing import Optional, Tuple
-from config.settings import AUDIO_SAMPLE_RATE, AUDIO_OUTPUT_DIR
+import speech_recognition as sr
+from typing import Optional, Tuple, Union
+from config.settings import (
+    AUDIO_SAMPLE_RATE,
+    AUDIO_OUTPUT_DIR,
+    CAPTURE_SAMPLE_RATE,
+    CAPTURE_DTYPE,
+    AUDIO_ARCHIVE_FORMAT,
+    OPUS_SAMPLE_RATES
+)
+
+try:
+    from scipy.signal import resample_poly
+except ImportError:  # scipy 為可選依賴，缺少時退回低通濾波加線性插值
+    resample_poly = None
+
+LOWPASS_TAPS = 63  # 無 scipy 時抗混疊濾波器的長度
+
+# 存檔格式 -> (副檔名, soundfile 格式, 子格式)
+ARCHIVE_FORMATS = {
+    "wav": (".wav", "WAV", "PCM_16"),
+    "flac": (".flac", "FLAC", "PCM_16"),
+    "opus": (".ogg", "OGG", "OPUS"),
+}
 
 class AudioUtils:
+    # 設備是否支援以 CAPTURE_SAMPLE_RATE 直接錄音（None 表示尚未檢查）
+    _capture_supported: Optional[bool] = None
+
     @staticmethod
     def generate_sine_wave(
         frequency: float = 440.0,
@@ -19,7 +46,8 @@ class AudioUtils:
     def record_audio(
         duration: float,
         channels: int = 1,
-        sample_rate: Optional[int] = None
+        sample_rate: Optional[int] = None,
+        dtype: str = 'float32'
     ) -> Tuple[np.ndarray, int]:
         """錄製音頻"""
         if sample_rate is None:
@@ -29,11 +57,139 @@ class AudioUtils:
             int(duration * sample_rate),
             samplerate=sample_rate,
             channels=channels,
-            dtype=np.float32
+            dtype=dtype
         )
         sd.wait()
         return recording, sample_rate
 
+    @staticmethod
+    def record_speech(duration: float) -> Tuple[np.ndarray, int]:
+        """以語音識別格式錄音（預設 16kHz 單聲道 int16）
+
+        若設備不支援該採樣率，改以 AUDIO_SAMPLE_RATE 錄製後重採樣；
+        檢查結果會被快取，之後的錄音直接使用對應方式。
+        """
+        recording = None
+        if AudioUtils._supports_capture_format():
+            try:
+                recording, sample_rate = AudioUtils.record_audio(
+                    duration,
+                    sample_rate=CAPTURE_SAMPLE_RATE,
+                    dtype=CAPTURE_DTYPE
+                )
+            except sd.PortAudioError:
+                AudioUtils._capture_supported = False
+
+        if recording is None:
+            recording, sample_rate = AudioUtils.record_audio(duration)
+            recording = AudioUtils.resample(
+                recording, sample_rate, CAPTURE_SAMPLE_RATE
+            )
+            sample_rate = CAPTURE_SAMPLE_RATE
+
+        if recording.ndim > 1:
+            recording = recording[:, 0]
+        return AudioUtils.to_int16(recording), sample_rate
+
+    @staticmethod
+    def _supports_capture_format() -> bool:
+        """檢查輸入設備是否支援語音錄製格式（只檢查一次）"""
+        if AudioUtils._capture_supported is None:
+            try:
+                sd.check_input_settings(
+                    channels=1,
+                    samplerate=CAPTURE_SAMPLE_RATE,
+                    dtype=CAPTURE_DTYPE
+                )
+                AudioUtils._capture_supported = True
+            except Exception:
+                AudioUtils._capture_supported = False
+        return AudioUtils._capture_supported
+
+    @staticmethod
+    def resample(data: np.ndarray, orig_rate: int, target_rate: int) -> np.ndarray:
+        """重採樣音頻（有 scipy 時使用多相濾波）"""
+        if orig_rate == target_rate:
+            return data
+        data = np.asarray(data, dtype=np.float32)
+        if resample_poly is not None:
+            factor = gcd(orig_rate, target_rate)
+            return resample_poly(
+                data, target_rate // factor, orig_rate // factor, axis=0
+            ).astype(np.float32)
+
+        if target_rate < orig_rate:
+            data = AudioUtils._lowpass(data, 0.45 * target_rate / orig_rate)
+
+        length = int(round(len(data) * target_rate / orig_rate))
+        src = np.arange(len(data)) / orig_rate
+        dst = np.arange(length) / target_rate
+        if data.ndim == 1:
+            return np.interp(dst, src, data).astype(np.float32)
+        return np.stack(
+            [np.interp(dst, src, data[:, ch]) for ch in range(data.shape[1])],
+            axis=1
+        ).astype(np.float32)
+
+    @staticmethod
+    def _lowpass(data: np.ndarray, cutoff: float) -> np.ndarray:
+        """以加窗 sinc FIR 低通濾波，cutoff 為相對採樣率的截止頻率"""
+        n = np.arange(LOWPASS_TAPS) - (LOWPASS_TAPS - 1) / 2
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(LOWPASS_TAPS)
+        taps /= taps.sum()
+        if data.ndim == 1:
+            return np.convolve(data, taps, mode='same').astype(np.float32)
+        return np.stack(
+            [np.convolve(data[:, ch], taps, mode='same') for ch in range(data.shape[1])],
+            axis=1
+        ).astype(np.float32)
+
+    @staticmethod
+    def to_int16(data: np.ndarray) -> np.ndarray:
+        """轉換為 int16 樣本"""
+        if data.dtype == np.int16:
+            return data
+        return (np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+
+    @staticmethod
+    def to_audio_data(data: np.ndarray, sample_rate: int) -> sr.AudioData:
+        """將 int16 單聲道樣本直接包裝為識別器輸入，無需先寫出 WAV"""
+        return sr.AudioData(AudioUtils.to_int16(data).tobytes(), sample_rate, 2)
+
+    @staticmethod
+    def _archive_format(
+        fmt: Optional[str],
+        sample_rate: int
+    ) -> Tuple[str, str, str]:
+        """解析存檔格式，libsndfile 不支援 Opus 或採樣率不適用於 Opus 時退回 FLAC"""
+        fmt = (fmt or AUDIO_ARCHIVE_FORMAT).lower()
+        if fmt not in ARCHIVE_FORMATS:
+            raise ValueError(f"不支援的音頻存檔格式: {fmt}")
+        if fmt == "opus" and (
+            sample_rate not in OPUS_SAMPLE_RATES
+            or "OPUS" not in sf.available_subtypes("OGG")
+        ):
+            fmt = "flac"
+        return ARCHIVE_FORMATS[fmt]
+
+    @staticmethod
+    def archive_suffix(sample_rate: int, fmt: Optional[str] = None) -> str:
+        """取得存檔格式對應的副檔名"""
+        return AudioUtils._archive_format(fmt, sample_rate)[0]
+
+    @staticmethod
+    def write_audio(
+        filepath: Union[str, Path],
+        data: np.ndarray,
+        sample_rate: int,
+        fmt: Optional[str] = None
+    ) -> str:
+        """以存檔格式寫入音頻，副檔名依格式調整，回傳實際路徑"""
+        suffix, format_, subtype = AudioUtils._archive_format(fmt, sample_rate)
+        filepath = Path(filepath).with_suffix(suffix)
+        sf.write(str(filepath), data, sample_rate, format=format_, subtype=subtype)
+        return str(filepath)
+
     @staticmethod
     def play_audio(
         data: np.ndarray,
@@ -53,15 +209,15 @@ class AudioUtils:
         filename: str,
         data: np.ndarray,
         sample_rate: Optional[int] = None,
-        subtype: str = 'PCM_24'
+        fmt: Optional[str] = None
     ) -> str:
-        """保存音頻文件"""
+        """保存音頻文件（依存檔格式壓縮，副檔名隨格式調整）"""
         if sample_rate is None:
             sample_rate = AUDIO_SAMPLE_RATE
 
-        filepath = AUDIO_OUTPUT_DIR / filename
-        sf.write(str(filepath), data, sample_rate, subtype=subtype)
-        return str(filepath)
+        return AudioUtils.write_audio(
+            AUDIO_OUTPUT_DIR / filename, data, sample_rate, fmt
+        )
 
     @staticmethod
     def load_audio(filepath: str) -> Tuple[np.ndarray, int]: